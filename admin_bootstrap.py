@@ -0,0 +1,53 @@
+"""Set the Admin user's email and password in one shot.
+
+Replaces update_email.py + update_password.py: one Core UPDATE instead
+of two full session lifecycles (SELECT + mutate + commit each), so
+there's one statement, one commit, one fsync.
+"""
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, '.')
+
+from sqlalchemy import update
+
+from app.database import SessionLocal
+from app.auth_utils import get_password_hash
+from app.models import User
+
+ADMIN_USERNAME = "Admin"
+ADMIN_EMAIL = "admin@cocoguard.com"
+ADMIN_PASSWORD = "cocoguard"
+
+# Script-local memo only — bcrypt is ~250ms per hash, and repeated
+# bootstrap runs reuse the same password. The app-wide helper stays
+# uncached on purpose.
+_hash = lru_cache(maxsize=32)(get_password_hash)
+
+db = SessionLocal()
+
+try:
+    result = db.execute(
+        update(User)
+        .where(User.username == ADMIN_USERNAME)
+        .values(email=ADMIN_EMAIL, password_hash=_hash(ADMIN_PASSWORD))
+    )
+    db.commit()
+
+    if result.rowcount:
+        print(f"✓ Admin user updated successfully!")
+        print(f"  Username: {ADMIN_USERNAME}")
+        print(f"  Email: {ADMIN_EMAIL}")
+        print(f"\n📝 New Login Credentials:")
+        print(f"   Email: {ADMIN_EMAIL}")
+        print(f"   Password: {ADMIN_PASSWORD}")
+    else:
+        print("✗ Admin user not found")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+    import traceback
+    traceback.print_exc()
+    db.rollback()
+finally:
+    db.close()
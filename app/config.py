@@ -33,6 +33,11 @@ class Settings(BaseSettings):
     twilio_auth_token: str = ""
     twilio_phone_number: str = ""
 
+    # Model warmup: run a dummy inference at startup so the first user
+    # request doesn't pay interpreter/JIT cold-start costs (off by
+    # default — too slow for free-tier hosts)
+    warmup_model_on_startup: bool = False
+
     # CORS (stored as raw string to avoid JSON parsing errors from env)
     allowed_origins_raw: str = "*"
     
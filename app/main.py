@@ -173,9 +173,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARNING] Database seeding error: {e}")
     
-    # Skip pre-loading TensorFlow model at startup (too slow for free tier)
-    # Model will be lazy-loaded on first prediction request instead
-    print("[INFO] Prediction model will be loaded on first request (lazy loading)")
+    # Pre-loading the TensorFlow model is opt-in: on the free tier it is
+    # too slow, so the default stays lazy-loading on first request
+    if settings.warmup_model_on_startup:
+        print("[INFO] Warming up prediction model...")
+        try:
+            from .services.prediction_service import get_prediction_service
+            get_prediction_service().warmup()
+        except Exception as e:
+            print(f"[WARNING] Model warmup failed: {e}")
+    else:
+        print("[INFO] Prediction model will be loaded on first request (lazy loading)")
     
     yield
     # Shutdown: cleanup if needed
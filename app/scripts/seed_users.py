@@ -0,0 +1,115 @@
+"""
+Seed well-known user accounts with a single upsert round trip.
+
+Replaces the check-then-insert pattern of the root-level
+create_admin_user.py / create_farmer_user.py scripts: one
+INSERT ... ON CONFLICT statement instead of two lookup queries plus an
+insert, which also closes the race window between check and insert.
+
+Usage:
+    python -m app.scripts.seed_users admin
+    python -m app.scripts.seed_users farmer
+"""
+
+import sys
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects.sqlite import insert
+
+from app.database import SessionLocal, engine, Base
+from app.models import User, UserRole, UserStatus
+from app.auth_utils import get_password_hash
+
+DEFAULT_PASSWORD = "cocoguard"
+
+ACCOUNTS = {
+    "admin": {
+        "username": "admin",
+        "email": "admin@cocoguard.com",
+        "full_name": "Admin User",
+        "role": UserRole.admin,
+        # Existing admin gets its password/role/status reset, matching
+        # the old create_admin_user.py behavior
+        "reset_existing": True,
+    },
+    "farmer": {
+        "username": "farmer",
+        "email": "farmer@cocoguard.com",
+        "full_name": "Test Farmer",
+        "role": UserRole.user,
+        "reset_existing": False,
+    },
+}
+
+
+def seed_user(kind: str) -> Optional[int]:
+    """
+    Upsert the given account in one statement.
+
+    Returns the affected user id, or None when the user already existed
+    and was left untouched (farmer case).
+    """
+    spec = ACCOUNTS[kind]
+
+    # Create tables if they don't exist; one sqlite_master lookup
+    # skips the full metadata walk on an already-initialized database
+    if not inspect(engine).has_table('users'):
+        Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        values = {
+            "username": spec["username"],
+            "email": spec["email"],
+            "password_hash": get_password_hash(DEFAULT_PASSWORD),
+            "role": spec["role"],
+            "status": UserStatus.active,
+            "full_name": spec["full_name"],
+        }
+        stmt = insert(User).values(**values)
+        if spec["reset_existing"]:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    "password_hash": values["password_hash"],
+                    "role": spec["role"],
+                    "status": UserStatus.active,
+                },
+            )
+        else:
+            # Covers both the email and username unique constraints
+            stmt = stmt.on_conflict_do_nothing()
+        user_id = db.execute(stmt.returning(User.id)).scalar()
+        db.commit()
+        return user_id
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(kind: str) -> int:
+    if kind not in ACCOUNTS:
+        print(f"Unknown account kind: {kind!r} (expected one of {sorted(ACCOUNTS)})")
+        return 1
+    spec = ACCOUNTS[kind]
+    try:
+        user_id = seed_user(kind)
+    except Exception as e:
+        print(f"✗ Error creating user: {str(e)}")
+        return 1
+
+    if user_id is None:
+        print(f"User '{spec['email']}' (or username '{spec['username']}') already exists, left unchanged.")
+    else:
+        print(f"✓ {kind.capitalize()} user ready (ID: {user_id})")
+        print(f"\nYou can now login with:")
+        print(f"  Email/Username: {spec['email']}")
+        print(f"  Password: {DEFAULT_PASSWORD}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else "admin"))
@@ -9,47 +9,73 @@ Photos taken with smartphone cameras often contain EXIF metadata including:
 - Orientation information
 """
 
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS
 from io import BytesIO
-from typing import Optional, Dict, Any, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+# Numba is optional; when present the batch converter JIT-compiles to a
+# parallel native loop, otherwise we fall back to plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-def _get_exif_data(image: Image.Image) -> Dict[str, Any]:
-    """Extract all EXIF data from an image"""
-    exif_data = {}
-    try:
-        info = image._getexif()
-        if info:
-            for tag_id, value in info.items():
-                tag = TAGS.get(tag_id, tag_id)
-                exif_data[tag] = value
-    except (AttributeError, KeyError, IndexError):
-        pass
-    return exif_data
+# diskcache is optional; when present, extracted metadata survives
+# restarts so re-uploads / re-scans skip the EXIF parse entirely.
+# Without it we fall back to a per-process dict.
+try:
+    import diskcache
+    _metadata_cache = diskcache.Cache("./.exif_cache")
+except ImportError:
+    _metadata_cache = {}
+
+logger = logging.getLogger(__name__)
 
+# Entry points accept raw bytes, an open buffer, or an already-opened
+# PIL image, so callers that need several fields from the same upload
+# can open it once instead of allocating a fresh BytesIO per call.
+ImageSource = Union[bytes, bytearray, BytesIO, Image.Image]
 
-def _get_gps_info(exif_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract GPS information from EXIF data"""
-    gps_info = {}
-    if "GPSInfo" not in exif_data:
-        return gps_info
-    
-    for key, value in exif_data["GPSInfo"].items():
-        gps_tag = GPSTAGS.get(key, key)
-        gps_info[gps_tag] = value
-    
-    return gps_info
+# EXIF IFD pointers and tag IDs (numeric, so we skip the TAGS/GPSTAGS
+# string-translation loop entirely)
+_IFD_GPSINFO = 0x8825
+_IFD_EXIF = 0x8769
+
+_TAG_GPS_LAT_REF = 1   # GPSLatitudeRef ("N"/"S")
+_TAG_GPS_LAT = 2       # GPSLatitude (d, m, s rationals)
+_TAG_GPS_LON_REF = 3   # GPSLongitudeRef ("E"/"W")
+_TAG_GPS_LON = 4       # GPSLongitude (d, m, s rationals)
+
+_TAG_MAKE = 0x010F
+_TAG_MODEL = 0x0110
+_TAG_DATETIME_ORIGINAL = 0x9003
+
+# GPS refs that flip the coordinate sign (south latitude / west
+# longitude); bytes variants appear in some malformed EXIF writers
+_NEG_REFS = frozenset({"S", "W", b"S", b"W"})
+
+# EXIF timestamps have a single fixed format, so a precompiled regex is
+# much cheaper than locale-aware strptime
+_DT_RE = re.compile(r"^(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})$")
 
 
 def _convert_to_degrees(value) -> Optional[float]:
     """
     Convert GPS coordinates from EXIF format (degrees, minutes, seconds) to decimal degrees
-    
+
     EXIF stores coordinates as:
     - Degrees: value[0]
-    - Minutes: value[1]  
+    - Minutes: value[1]
     - Seconds: value[2]
     """
     try:
@@ -57,65 +83,186 @@ def _convert_to_degrees(value) -> Optional[float]:
         d = float(value[0])
         m = float(value[1])
         s = float(value[2])
-        
+
         return d + (m / 60.0) + (s / 3600.0)
     except (TypeError, ValueError, IndexError, ZeroDivisionError):
         return None
 
 
-def extract_gps_from_bytes(image_bytes: bytes) -> Tuple[Optional[float], Optional[float]]:
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _convert_dms_batch(dms, signs, out):  # pragma: no cover - native code
+        for i in prange(dms.shape[0]):
+            out[i] = signs[i] * (dms[i, 0] + dms[i, 1] / 60.0 + dms[i, 2] / 3600.0)
+else:
+    def _convert_dms_batch(dms, signs, out):
+        np.multiply(signs, dms[:, 0] + dms[:, 1] / 60.0 + dms[:, 2] / 3600.0, out=out)
+
+
+def convert_dms_batch(dms: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of degree/minute/second values to signed
+    decimal degrees in one pass.
+
+    `signs` is an (N,) vector of +1.0 / -1.0 (from the N/S or E/W ref).
+    For bulk workloads (e.g. admin re-imports of thousands of photos)
+    this replaces N Python-level _convert_to_degrees calls with a single
+    vectorized - and, with numba installed, parallel JIT-compiled - loop.
+    """
+    dms = np.ascontiguousarray(dms, dtype=np.float64)
+    signs = np.ascontiguousarray(signs, dtype=np.float64)
+    out = np.empty(dms.shape[0], dtype=np.float64)
+    _convert_dms_batch(dms, signs, out)
+    return out
+
+
+def extract_gps_batch(images: Sequence[ImageSource]) -> List[Tuple[Optional[float], Optional[float]]]:
+    """
+    Extract GPS coordinates for a batch of images.
+
+    The per-image EXIF walk still happens in Pillow, but all the
+    rational-to-degrees arithmetic is collected into flat arrays and
+    converted in one convert_dms_batch call.
+    """
+    coords: List[Tuple[Optional[float], Optional[float]]] = [(None, None)] * len(images)
+    dms_rows = []
+    signs = []
+    slots = []  # (result index, is_longitude)
+
+    for idx, source in enumerate(images):
+        try:
+            gps_ifd = _get_gps_ifd(_open_for_exif(source))
+        except Exception as e:
+            logger.debug("[EXIF] Error extracting GPS data: %s", e)
+            continue
+        if not gps_ifd:
+            continue
+
+        for tag, ref_tag, is_lon in (
+            (_TAG_GPS_LAT, _TAG_GPS_LAT_REF, False),
+            (_TAG_GPS_LON, _TAG_GPS_LON_REF, True),
+        ):
+            if tag in gps_ifd and ref_tag in gps_ifd:
+                try:
+                    value = gps_ifd[tag]
+                    dms_rows.append((float(value[0]), float(value[1]), float(value[2])))
+                except (TypeError, ValueError, IndexError, ZeroDivisionError):
+                    continue
+                signs.append(_ref_sign(gps_ifd[ref_tag]))
+                slots.append((idx, is_lon))
+
+    if dms_rows:
+        degrees = convert_dms_batch(np.array(dms_rows), np.array(signs))
+        for (idx, is_lon), value in zip(slots, degrees):
+            lat, lon = coords[idx]
+            coords[idx] = (lat, float(value)) if is_lon else (float(value), lon)
+
+    return coords
+
+
+def _open_for_exif(source: ImageSource) -> Image.Image:
+    """
+    Open an image for metadata-only access.
+
+    Accepts raw bytes, an already-open buffer, or a PIL image (returned
+    as-is, so repeated extractions share one decode). `draft()` tells
+    libjpeg to prepare its cheapest decode path; since we never call
+    `load()` the pixel data is never actually decoded, so the open cost
+    is just the header/EXIF walk.
+    """
+    if isinstance(source, Image.Image):
+        return source
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+    image = Image.open(source)
+    try:
+        image.draft("L", (1, 1))
+    except Exception:
+        pass
+    return image
+
+
+def _get_gps_ifd(image: Image.Image) -> Dict[int, Any]:
+    """
+    Return the GPS IFD from an image's EXIF data, keyed by numeric tag ID.
+
+    Uses the public `Image.getexif()` API (which caches the parsed EXIF
+    internally) instead of the private `_getexif()` that re-parses the
+    APP1 segment and copies everything into a fresh dict on every call.
+    """
+    try:
+        return image.getexif().get_ifd(_IFD_GPSINFO)
+    except (AttributeError, KeyError, IndexError):
+        return {}
+
+
+def _ref_sign(ref) -> float:
+    """Sign multiplier for a GPS ref: -1.0 for S/W, +1.0 for N/E"""
+    return -1.0 if ref in _NEG_REFS else 1.0
+
+
+def _extract_lat_lon(gps_ifd: Dict[int, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Decode (latitude, longitude) in decimal degrees from a GPS IFD"""
+    lat = None
+    if _TAG_GPS_LAT in gps_ifd and _TAG_GPS_LAT_REF in gps_ifd:
+        lat = _convert_to_degrees(gps_ifd[_TAG_GPS_LAT])
+        if lat is not None:
+            # South latitudes are negative
+            lat *= _ref_sign(gps_ifd[_TAG_GPS_LAT_REF])
+
+    lon = None
+    if _TAG_GPS_LON in gps_ifd and _TAG_GPS_LON_REF in gps_ifd:
+        lon = _convert_to_degrees(gps_ifd[_TAG_GPS_LON])
+        if lon is not None:
+            # West longitudes are negative
+            lon *= _ref_sign(gps_ifd[_TAG_GPS_LON_REF])
+
+    return lat, lon
+
+
+def extract_gps_from_bytes(image_bytes: ImageSource) -> Tuple[Optional[float], Optional[float]]:
     """
     Extract GPS coordinates from image bytes
-    
+
     Args:
-        image_bytes: Raw image file bytes
-        
+        image_bytes: Raw image bytes, an open buffer, or a PIL image
+
     Returns:
         Tuple of (latitude, longitude) or (None, None) if not available
     """
     try:
-        image = Image.open(BytesIO(image_bytes))
-        exif_data = _get_exif_data(image)
-        gps_info = _get_gps_info(exif_data)
-        
-        if not gps_info:
+        image = _open_for_exif(image_bytes)
+        gps_ifd = _get_gps_ifd(image)
+
+        if not gps_ifd:
             return None, None
-        
-        # Extract latitude
-        lat = None
-        if "GPSLatitude" in gps_info and "GPSLatitudeRef" in gps_info:
-            lat = _convert_to_degrees(gps_info["GPSLatitude"])
-            if lat is not None:
-                # South latitudes are negative
-                if gps_info["GPSLatitudeRef"] == "S":
-                    lat = -lat
-        
-        # Extract longitude
-        lon = None
-        if "GPSLongitude" in gps_info and "GPSLongitudeRef" in gps_info:
-            lon = _convert_to_degrees(gps_info["GPSLongitude"])
-            if lon is not None:
-                # West longitudes are negative
-                if gps_info["GPSLongitudeRef"] == "W":
-                    lon = -lon
-        
-        return lat, lon
-        
+
+        return _extract_lat_lon(gps_ifd)
+
     except Exception as e:
-        print(f"[EXIF] Error extracting GPS data: {e}")
+        logger.debug("[EXIF] Error extracting GPS data: %s", e)
         return None, None
 
 
-def extract_full_metadata(image_bytes: bytes) -> Dict[str, Any]:
+def extract_full_metadata(image_bytes: ImageSource) -> Dict[str, Any]:
     """
     Extract comprehensive metadata from image including GPS, timestamp, camera info
-    
+
     Args:
-        image_bytes: Raw image file bytes
-        
+        image_bytes: Raw image bytes, an open buffer, or a PIL image
+
     Returns:
         Dictionary with extracted metadata
     """
+    # Re-uploads and admin re-scans hit the same bytes repeatedly; the
+    # EXIF block lives in the header, so the first 64KB identify it.
+    cache_key = None
+    if isinstance(image_bytes, (bytes, bytearray)):
+        cache_key = hashlib.sha1(bytes(image_bytes[:65536])).hexdigest()
+        cached = _metadata_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
     result = {
         "latitude": None,
         "longitude": None,
@@ -124,51 +271,87 @@ def extract_full_metadata(image_bytes: bytes) -> Dict[str, Any]:
         "camera_model": None,
         "has_gps": False,
     }
-    
+
     try:
-        image = Image.open(BytesIO(image_bytes))
-        exif_data = _get_exif_data(image)
-        
+        image = _open_for_exif(image_bytes)
+        exif = image.getexif()
+
         # Extract GPS coordinates
-        gps_info = _get_gps_info(exif_data)
-        if gps_info:
-            lat, lon = None, None
-            
-            if "GPSLatitude" in gps_info and "GPSLatitudeRef" in gps_info:
-                lat = _convert_to_degrees(gps_info["GPSLatitude"])
-                if lat is not None and gps_info["GPSLatitudeRef"] == "S":
-                    lat = -lat
-            
-            if "GPSLongitude" in gps_info and "GPSLongitudeRef" in gps_info:
-                lon = _convert_to_degrees(gps_info["GPSLongitude"])
-                if lon is not None and gps_info["GPSLongitudeRef"] == "W":
-                    lon = -lon
-            
+        gps_ifd = exif.get_ifd(_IFD_GPSINFO)
+        if gps_ifd:
+            lat, lon = _extract_lat_lon(gps_ifd)
             if lat is not None and lon is not None:
                 result["latitude"] = lat
                 result["longitude"] = lon
                 result["has_gps"] = True
-        
-        # Extract timestamp (when photo was taken)
-        datetime_original = exif_data.get("DateTimeOriginal")
+
+        # Extract timestamp (when photo was taken) - DateTimeOriginal
+        # lives in the Exif sub-IFD
+        datetime_original = exif.get_ifd(_IFD_EXIF).get(_TAG_DATETIME_ORIGINAL)
         if datetime_original:
-            try:
-                result["timestamp"] = datetime.strptime(datetime_original, "%Y:%m:%d %H:%M:%S")
-            except ValueError:
-                pass
-        
+            m = _DT_RE.match(datetime_original)
+            if m:
+                try:
+                    result["timestamp"] = datetime(*map(int, m.groups()))
+                except ValueError:
+                    pass
+
         # Extract camera information
-        result["camera_make"] = exif_data.get("Make")
-        result["camera_model"] = exif_data.get("Model")
-        
+        result["camera_make"] = exif.get(_TAG_MAKE)
+        result["camera_model"] = exif.get(_TAG_MODEL)
+
     except Exception as e:
-        print(f"[EXIF] Error extracting metadata: {e}")
-    
+        logger.debug("[EXIF] Error extracting metadata: %s", e)
+        return result
+
+    if cache_key is not None:
+        try:
+            _metadata_cache[cache_key] = dict(result)
+        except Exception as e:
+            logger.debug("[EXIF] Failed to cache metadata: %s", e)
+
     return result
 
 
+# Pillow's libjpeg header walk releases the GIL, so a small thread pool
+# keeps the FastAPI event loop free under concurrent uploads
+_EXIF_POOL = ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 2) // 2),
+    thread_name_prefix="exif",
+)
+
+
+async def extract_gps_from_bytes_async(image_bytes: ImageSource) -> Tuple[Optional[float], Optional[float]]:
+    """Async wrapper for extract_gps_from_bytes; runs off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXIF_POOL, extract_gps_from_bytes, image_bytes
+    )
+
+
+async def extract_full_metadata_async(image_bytes: ImageSource) -> Dict[str, Any]:
+    """Async wrapper for extract_full_metadata; runs off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXIF_POOL, extract_full_metadata, image_bytes
+    )
+
+
 # Convenience function for quick GPS check
-def has_gps_data(image_bytes: bytes) -> bool:
-    """Check if image contains GPS data"""
-    lat, lon = extract_gps_from_bytes(image_bytes)
-    return lat is not None and lon is not None
+def has_gps_data(image_bytes: ImageSource) -> bool:
+    """
+    Check if image contains GPS data
+
+    Only tag presence is needed to answer the boolean, so this skips the
+    rational-to-degrees conversion that extract_gps_from_bytes performs.
+    """
+    try:
+        gps_ifd = _get_gps_ifd(_open_for_exif(image_bytes))
+        return bool(
+            gps_ifd
+            and _TAG_GPS_LAT_REF in gps_ifd
+            and _TAG_GPS_LAT in gps_ifd
+            and _TAG_GPS_LON_REF in gps_ifd
+            and _TAG_GPS_LON in gps_ifd
+        )
+    except Exception as e:
+        logger.debug("[EXIF] Error checking GPS data: %s", e)
+        return False
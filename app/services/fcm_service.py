@@ -12,6 +12,9 @@ Requirements:
 
 import os
 import json
+import asyncio
+import functools
+import logging
 import httpx
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -23,7 +26,11 @@ try:
     FIREBASE_AVAILABLE = True
 except ImportError:
     FIREBASE_AVAILABLE = False
-    print("[FCM] firebase-admin not installed. Run: pip install firebase-admin")
+
+logger = logging.getLogger(__name__)
+
+if not FIREBASE_AVAILABLE:
+    logger.warning("[FCM] firebase-admin not installed. Run: pip install firebase-admin")
 
 # Path to the Firebase service account key file
 FIREBASE_CREDS_PATH = os.path.join(
@@ -37,24 +44,45 @@ PEST_ALERTS_TOPIC = "pest_alerts"
 # Flag to track if Firebase is initialized
 _firebase_initialized = False
 
+# Tri-state init result: None = not attempted yet, True = initialized,
+# False = known-unavailable (missing SDK or credentials). Caching the
+# negative result lets every send helper bail out with one bool check
+# instead of re-probing the filesystem/environment per notification.
+_firebase_state: Optional[bool] = None
+
+
+def _prewarm_messaging():
+    """
+    Instantiate the messaging service (and its internal HTTP session)
+    once at init, so the first alert send doesn't pay the transport/TLS
+    setup cost. Uses a private firebase-admin hook, hence best-effort.
+    """
+    try:
+        messaging._get_messaging_service(firebase_admin.get_app())
+    except Exception as e:
+        logger.debug("[FCM] Messaging service prewarm failed: %s", e)
+
 
 def init_firebase():
     """Initialize Firebase Admin SDK if not already initialized"""
-    global _firebase_initialized
-    
+    global _firebase_initialized, _firebase_state
+
+    if _firebase_state is not None:
+        return _firebase_state
+
     if not FIREBASE_AVAILABLE:
-        print("[FCM] Firebase Admin SDK not available. Push notifications disabled.")
+        logger.warning("[FCM] Firebase Admin SDK not available. Push notifications disabled.")
+        _firebase_state = False
         return False
-    
-    if _firebase_initialized:
-        return True
-    
+
     try:
         if os.path.exists(FIREBASE_CREDS_PATH):
             cred = credentials.Certificate(FIREBASE_CREDS_PATH)
             firebase_admin.initialize_app(cred)
             _firebase_initialized = True
-            print(f"[FCM] Firebase initialized with credentials from {FIREBASE_CREDS_PATH}")
+            _firebase_state = True
+            _prewarm_messaging()
+            logger.info("[FCM] Firebase initialized with credentials from %s", FIREBASE_CREDS_PATH)
             return True
         else:
             # Try environment variable
@@ -64,17 +92,73 @@ def init_firebase():
                 cred = credentials.Certificate(cred_dict)
                 firebase_admin.initialize_app(cred)
                 _firebase_initialized = True
-                print("[FCM] Firebase initialized with credentials from environment variable")
+                _firebase_state = True
+                _prewarm_messaging()
+                logger.info("[FCM] Firebase initialized with credentials from environment variable")
                 return True
             else:
-                print(f"[FCM] Firebase credentials not found at {FIREBASE_CREDS_PATH}")
-                print("[FCM] Push notifications are disabled until Firebase is configured.")
+                logger.warning("[FCM] Firebase credentials not found at %s", FIREBASE_CREDS_PATH)
+                logger.warning("[FCM] Push notifications are disabled until Firebase is configured.")
+                _firebase_state = False
                 return False
     except Exception as e:
-        print(f"[FCM] Failed to initialize Firebase: {e}")
+        logger.error("[FCM] Failed to initialize Firebase: %s", e)
+        _firebase_state = False
         return False
 
 
+@functools.lru_cache(maxsize=64)
+def _build_notification(title: str, body: str) -> "messaging.Notification":
+    """Build (and memoize) the basic notification payload"""
+    return messaging.Notification(title=title, body=body)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_android_config(title: str, body: str, is_critical: bool) -> "messaging.AndroidConfig":
+    """Build (and memoize) the Android heads-up notification config"""
+    return messaging.AndroidConfig(
+        priority='high',
+        notification=messaging.AndroidNotification(
+            title=title,
+            body=body,
+            icon='ic_launcher',
+            color='#DC3545' if is_critical else '#2D7A3E',
+            channel_id='pest_alerts_channel',
+            priority='max',
+            visibility='public',
+            notification_count=1,
+            default_vibrate_timings=True,  # Use default vibration
+        ),
+        ttl=timedelta(hours=1)  # 1 hour TTL
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _build_apns_config(title: str, body: str) -> "messaging.APNSConfig":
+    """Build (and memoize) the iOS/APNs notification config"""
+    return messaging.APNSConfig(
+        headers={
+            'apns-priority': '10',
+            'apns-push-type': 'alert'
+        },
+        payload=messaging.APNSPayload(
+            aps=messaging.Aps(
+                alert=messaging.ApsAlert(
+                    title=title,
+                    body=body,
+                ),
+                badge=1,
+                sound=messaging.CriticalSound(
+                    name='default',
+                    critical=True,
+                    volume=1.0
+                ),
+                mutable_content=True,
+            )
+        )
+    )
+
+
 def send_pest_alert_notification(
     pest_type: str,
     location_text: Optional[str] = None,
@@ -121,45 +205,12 @@ def send_pest_alert_notification(
         "click_action": "FLUTTER_NOTIFICATION_CLICK"
     }
     
-    # Android notification configuration for heads-up display
-    android_config = messaging.AndroidConfig(
-        priority='high',
-        notification=messaging.AndroidNotification(
-            title=title,
-            body=body,
-            icon='ic_launcher',
-            color='#DC3545' if 'APW' in pest_type else '#2D7A3E',
-            channel_id='pest_alerts_channel',
-            priority='max',
-            visibility='public',
-            notification_count=1,
-            default_vibrate_timings=True,  # Use default vibration
-        ),
-        ttl=timedelta(hours=1)  # 1 hour TTL
-    )
-    
-    # iOS/APNs configuration
-    apns_config = messaging.APNSConfig(
-        headers={
-            'apns-priority': '10',
-            'apns-push-type': 'alert'
-        },
-        payload=messaging.APNSPayload(
-            aps=messaging.Aps(
-                alert=messaging.ApsAlert(
-                    title=title,
-                    body=body,
-                ),
-                badge=1,
-                sound=messaging.CriticalSound(
-                    name='default',
-                    critical=True,
-                    volume=1.0
-                ),
-                mutable_content=True,
-            )
-        )
-    )
+    # Notification/config objects are immutable for a given (title, body,
+    # criticality), so reuse memoized instances across bursts of alerts
+    # instead of reallocating them on every call.
+    notification = _build_notification(title, body)
+    android_config = _build_android_config(title, body, 'APW' in pest_type)
+    apns_config = _build_apns_config(title, body)
     
     results = {
         "success": True,
@@ -173,10 +224,7 @@ def send_pest_alert_notification(
     if send_to_topic:
         try:
             topic_message = messaging.Message(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body,
-                ),
+                notification=notification,
                 data=data,
                 android=android_config,
                 apns=apns_config,
@@ -185,10 +233,10 @@ def send_pest_alert_notification(
             response = messaging.send(topic_message)
             results["topic_sent"] = True
             results["details"].append(f"Topic message sent: {response}")
-            print(f"[FCM] ✅ Sent to topic '{PEST_ALERTS_TOPIC}': {response}")
+            logger.info("[FCM] Sent to topic '%s': %s", PEST_ALERTS_TOPIC, response)
         except Exception as e:
             results["details"].append(f"Topic send failed: {str(e)}")
-            print(f"[FCM] ❌ Failed to send to topic: {e}")
+            logger.error("[FCM] Failed to send to topic: %s", e)
     
     # Send to specific device tokens
     if fcm_tokens:
@@ -200,11 +248,10 @@ def send_pest_alert_notification(
             for i in range(0, len(valid_tokens), 500):
                 batch_tokens = valid_tokens[i:i+500]
                 
+                # Only the token list differs between batches; the shared
+                # notification/config objects are reused as-is.
                 multicast_message = messaging.MulticastMessage(
-                    notification=messaging.Notification(
-                        title=title,
-                        body=body,
-                    ),
+                    notification=notification,
                     data=data,
                     android=android_config,
                     apns=apns_config,
@@ -216,19 +263,20 @@ def send_pest_alert_notification(
                     results["tokens_sent"] += response.success_count
                     results["tokens_failed"] += response.failure_count
                     
-                    print(f"[FCM] ✅ Multicast: {response.success_count} success, "
-                          f"{response.failure_count} failed")
+                    logger.info("[FCM] Multicast: %d success, %d failed",
+                                response.success_count, response.failure_count)
                     
-                    # Log failed tokens for cleanup
-                    if response.failure_count > 0:
+                    # Log failed tokens for cleanup (debug-only so the
+                    # per-token formatting never runs in production)
+                    if response.failure_count > 0 and logger.isEnabledFor(logging.DEBUG):
                         for idx, resp in enumerate(response.responses):
                             if not resp.success:
-                                print(f"[FCM] ❌ Failed token: {batch_tokens[idx][:20]}... "
-                                      f"Error: {resp.exception}")
+                                logger.debug("[FCM] Failed token: %s... Error: %s",
+                                             batch_tokens[idx][:20], resp.exception)
                                 
                 except Exception as e:
                     results["details"].append(f"Multicast failed: {str(e)}")
-                    print(f"[FCM] ❌ Multicast send failed: {e}")
+                    logger.error("[FCM] Multicast send failed: %s", e)
     
     # Calculate overall success
     results["message"] = (
@@ -239,6 +287,119 @@ def send_pest_alert_notification(
     return results
 
 
+async def send_pest_alert_notification_async(
+    pest_type: str,
+    location_text: Optional[str] = None,
+    scan_id: Optional[int] = None,
+    fcm_tokens: Optional[List[str]] = None,
+    send_to_topic: bool = True
+) -> Dict[str, Any]:
+    """
+    Async variant of send_pest_alert_notification.
+
+    Instead of sending the 500-token multicast batches one after another
+    (one blocking HTTPS round-trip each), all batches are dispatched
+    concurrently on the default executor and awaited together, so total
+    latency is roughly one round-trip regardless of token count.
+    """
+    if not init_firebase():
+        return {
+            "success": False,
+            "message": "Firebase not initialized. Push notifications disabled.",
+            "sent_count": 0
+        }
+
+    title = "⚠️ Mapanganib na Peste ang Natuklasan!"
+    body = (
+        f"Ang {pest_type} ay natuklasan sa lugar na: "
+        f"{location_text or 'Hindi matukoy ang lokasyon'}. "
+        "Mangyaring suriin ang inyong mga puno ng niyog."
+    )
+
+    data = {
+        "type": "pest_alert",
+        "pest_type": pest_type,
+        "location_text": location_text or "",
+        "scan_id": str(scan_id) if scan_id else "",
+        "is_critical": "true" if "APW" in pest_type else "false",
+        "timestamp": datetime.now().isoformat(),
+        "click_action": "FLUTTER_NOTIFICATION_CLICK"
+    }
+
+    notification = _build_notification(title, body)
+    android_config = _build_android_config(title, body, 'APW' in pest_type)
+    apns_config = _build_apns_config(title, body)
+
+    results = {
+        "success": True,
+        "topic_sent": False,
+        "tokens_sent": 0,
+        "tokens_failed": 0,
+        "details": []
+    }
+
+    loop = asyncio.get_running_loop()
+
+    if send_to_topic:
+        try:
+            topic_message = messaging.Message(
+                notification=notification,
+                data=data,
+                android=android_config,
+                apns=apns_config,
+                topic=PEST_ALERTS_TOPIC
+            )
+            response = await loop.run_in_executor(None, messaging.send, topic_message)
+            results["topic_sent"] = True
+            results["details"].append(f"Topic message sent: {response}")
+            logger.info("[FCM] Sent to topic '%s': %s", PEST_ALERTS_TOPIC, response)
+        except Exception as e:
+            results["details"].append(f"Topic send failed: {str(e)}")
+            logger.error("[FCM] Failed to send to topic: %s", e)
+
+    if fcm_tokens:
+        valid_tokens = [t for t in fcm_tokens if t]
+
+        if valid_tokens:
+            # One MulticastMessage per 500-token batch (FCM's per-call cap),
+            # all dispatched concurrently instead of serially.
+            batch_messages = [
+                messaging.MulticastMessage(
+                    notification=notification,
+                    data=data,
+                    android=android_config,
+                    apns=apns_config,
+                    tokens=valid_tokens[i:i+500]
+                )
+                for i in range(0, len(valid_tokens), 500)
+            ]
+
+            responses = await asyncio.gather(
+                *[
+                    loop.run_in_executor(None, messaging.send_each_for_multicast, m)
+                    for m in batch_messages
+                ],
+                return_exceptions=True
+            )
+
+            for response in responses:
+                if isinstance(response, Exception):
+                    results["details"].append(f"Multicast failed: {str(response)}")
+                    logger.error("[FCM] Multicast send failed: %s", response)
+                else:
+                    results["tokens_sent"] += response.success_count
+                    results["tokens_failed"] += response.failure_count
+                    logger.info("[FCM] Multicast: %d success, %d failed",
+                                response.success_count, response.failure_count)
+
+    results["message"] = (
+        f"Sent to topic: {results['topic_sent']}, "
+        f"Tokens: {results['tokens_sent']} success, {results['tokens_failed']} failed"
+    )
+
+    return results
+
+
 def send_notification_to_token(
     token: str,
     title: str,
@@ -270,10 +431,10 @@ def send_notification_to_token(
             token=token,
         )
         response = messaging.send(message)
-        print(f"[FCM] ✅ Sent to token: {response}")
+        logger.info("[FCM] Sent to token: %s", response)
         return True
     except Exception as e:
-        print(f"[FCM] ❌ Failed to send to token: {e}")
+        logger.error("[FCM] Failed to send to token: %s", e)
         return False
 
 
@@ -308,8 +469,8 @@ def send_topic_notification(
             topic=topic,
         )
         response = messaging.send(message)
-        print(f"[FCM] ✅ Sent to topic '{topic}': {response}")
+        logger.info("[FCM] Sent to topic '%s': %s", topic, response)
         return True
     except Exception as e:
-        print(f"[FCM] ❌ Failed to send to topic: {e}")
+        logger.error("[FCM] Failed to send to topic: %s", e)
         return False
@@ -1,9 +1,31 @@
+import asyncio
+import threading
+from typing import Optional
+
 from twilio.rest import Client
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Reuse one Twilio client across sends: it holds a pooled HTTP session,
+# so consecutive SMS reuse the TCP+TLS connection instead of
+# re-handshaking per call
+_twilio_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_twilio_client() -> Client:
+    global _twilio_client
+    if _twilio_client is None:
+        with _client_lock:
+            if _twilio_client is None:
+                _twilio_client = Client(
+                    settings.twilio_account_sid, settings.twilio_auth_token
+                )
+    return _twilio_client
+
+
 async def send_verification_sms(to_phone: str, code: str) -> bool:
     """Send verification code via SMS using Twilio"""
     try:
@@ -11,16 +33,17 @@ async def send_verification_sms(to_phone: str, code: str) -> bool:
             logger.warning("Twilio credentials not configured, skipping SMS send")
             return False
 
-        # Initialize Twilio client
-        client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+        client = _get_twilio_client()
 
         # Format phone number to E.164 format if needed
         if not to_phone.startswith("+"):
             # Assume Philippine number if no country code
             to_phone = f"+63{to_phone.lstrip('0')}"
 
-        # Send SMS
-        message = client.messages.create(
+        # Send SMS off the event loop — messages.create is a blocking
+        # HTTP call
+        message = await asyncio.to_thread(
+            client.messages.create,
             body=f"Your CocoGuard verification code is: {code}. This code will expire in 10 minutes.",
             from_=settings.twilio_phone_number,
             to=to_phone
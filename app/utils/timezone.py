@@ -8,40 +8,49 @@ This module provides utilities to convert timestamps to Manila timezone (UTC+8).
 from datetime import datetime, timezone, timedelta
 
 # Philippines timezone (UTC+8)
-PH_TIMEZONE = timezone(timedelta(hours=8))
+PH_OFFSET = timedelta(hours=8)
+PH_TIMEZONE = timezone(PH_OFFSET)
 
 
 def to_manila_time(dt: datetime) -> datetime:
     """Convert datetime from SQLite (UTC) to Manila timezone
-    
+
     Args:
         dt: datetime object (naive or aware)
-        
+
     Returns:
         datetime object in Manila timezone
     """
     if dt is None:
         return None
-    # SQLite stores UTC time, so treat naive datetime as UTC
+    # SQLite stores UTC time, so treat naive datetime as UTC. For that
+    # common case the conversion is a fixed +8h shift — no tzinfo walk
+    # through astimezone, which matters when serializing long scan lists.
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    # Convert to Manila timezone (UTC+8)
+        return (dt + PH_OFFSET).replace(tzinfo=PH_TIMEZONE)
     return dt.astimezone(PH_TIMEZONE)
 
 
 def to_manila_iso(dt: datetime) -> str:
     """Convert datetime from SQLite (UTC) to Manila timezone ISO string
-    
+
     Args:
         dt: datetime object (naive or aware)
-        
+
     Returns:
         ISO format string with timezone info, e.g., "2026-02-05T10:30:00+08:00"
     """
-    manila_dt = to_manila_time(dt)
-    if manila_dt is None:
+    m = to_manila_time(dt)
+    if m is None:
         return None
-    return manila_dt.isoformat()
+    # Direct f-string formatting; the fixed "+08:00" suffix skips
+    # isoformat's tzinfo offset computation per row
+    if m.microsecond:
+        return (f"{m.year:04d}-{m.month:02d}-{m.day:02d}"
+                f"T{m.hour:02d}:{m.minute:02d}:{m.second:02d}"
+                f".{m.microsecond:06d}+08:00")
+    return (f"{m.year:04d}-{m.month:02d}-{m.day:02d}"
+            f"T{m.hour:02d}:{m.minute:02d}:{m.second:02d}+08:00")
 
 
 def now_manila() -> datetime:
@@ -2,7 +2,11 @@ import sqlite3
 conn = sqlite3.connect('cocoguard.db')
 tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
 print('=== ALL TABLES ===')
-for t in tables:
-    count = conn.execute(f'SELECT COUNT(*) FROM [{t[0]}]').fetchone()[0]
-    print(f'  {t[0]}: {count} rows')
+if tables:
+    # One UNION ALL statement instead of a COUNT(*) round-trip per table
+    query = " UNION ALL ".join(
+        f"SELECT '{t[0]}' AS name, COUNT(*) AS c FROM [{t[0]}]" for t in tables
+    )
+    for name, count in conn.execute(query).fetchall():
+        print(f'  {name}: {count} rows')
 conn.close()
@@ -0,0 +1,153 @@
+"""
+Batch-scan ALL images in uploads/scans + assets/ to discover
+which of the 7 pest types the model can detect.
+
+Replaces batch_scan_all.py / batch_scan_v2.py (which were ~90%
+identical). The model is initialized exactly once, images are scanned
+in parallel across the service's interpreter pool, and results are
+memoized by content hash so re-runs only infer new or changed images.
+"""
+import argparse
+import hashlib
+import io
+import os
+import shelve
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
+
+ALL_PESTS = ['APW Adult', 'APW Larvae', 'Brontispa', 'Brontispa Pupa',
+             'Rhinoceros Beetle', 'Slug Caterpillar', 'White Grub']
+
+parser = argparse.ArgumentParser(description="Batch-scan images through the pest model")
+parser.add_argument('--output', choices=['console', 'file'], default='console',
+                    help="where the report goes: console, or batch_scan_results.txt")
+parser.add_argument('--threshold', type=float, default=0.55,
+                    help="confidence threshold (default: 0.55)")
+parser.add_argument('--top', type=int, default=5,
+                    help="detections to list per pest type (default: 5)")
+parser.add_argument('--no-cache', action='store_true',
+                    help="ignore and don't update the content-hash result cache")
+parser.add_argument('--assets-dir', default=r"C:\xampp\htdocs\assets",
+                    help="extra image directory to include")
+args = parser.parse_args()
+
+# Swallow the model's internal chatter; its logger is quiet by default
+# but TF's Python side still prints during load
+import logging
+logging.getLogger('app.services.prediction_service').setLevel(logging.WARNING)
+_sink = io.StringIO()
+
+with redirect_stdout(_sink):
+    from app.services.prediction_service import get_prediction_service
+    svc = get_prediction_service()
+if not svc.model_loaded:
+    print("ERROR: Model not loaded!")
+    sys.exit(1)
+
+SCAN_DIR = Path(__file__).parent / "uploads" / "scans"
+images = sorted(str(p) for p in SCAN_DIR.glob("*.jpg"))
+images += sorted(str(p) for p in Path(args.assets_dir).glob("*.jpg"))
+
+print(f"Found {len(images)} images to scan")
+print("=" * 90)
+
+# Content-hash result cache: re-runs only pay inference for the diff
+CACHE_PATH = os.path.join(os.path.dirname(__file__), ".batch_scan_cache")
+_cache_store = shelve.open(CACHE_PATH) if not args.no_cache else None
+_cache = dict(_cache_store) if _cache_store is not None else {}
+
+pest_hits = {}  # pest_type -> [(confidence, tta_agreement, tta_total, filename), ...]
+out_of_scope = 0
+errors = 0
+
+
+def _scan_one(img_path):
+    try:
+        with open(img_path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        cached = _cache.get(digest)
+        if cached is not None:
+            return digest, cached, True
+        return digest, svc.predict_from_bytes(data, confidence_threshold=args.threshold), False
+    except Exception:
+        return None, None, False
+
+
+# Parallel scan: TFLite releases the GIL during invoke and each thread
+# checks out its own interpreter from the service pool
+WORKERS = min(os.cpu_count() or 4, svc.MAX_INTERPRETER_POOL)
+with redirect_stdout(_sink):
+    with ThreadPoolExecutor(max_workers=WORKERS) as ex:
+        for i, (img_path, (digest, result, from_cache)) in enumerate(
+                zip(images, ex.map(_scan_one, images))):
+            fname = os.path.basename(img_path)
+            if result is None:
+                errors += 1
+                continue
+            if not from_cache and _cache_store is not None:
+                _cache_store[digest] = result
+
+            preds = result.get('predictions', [])
+            if preds:
+                best = preds[0]
+                pest_hits.setdefault(best['pest_type'], []).append((
+                    best['confidence'],
+                    best.get('tta_agreement', '?'),
+                    best.get('tta_total', '?'),
+                    fname,
+                ))
+            else:
+                out_of_scope += 1
+
+            if (i + 1) % 20 == 0:
+                print(f"  Processed {i+1}/{len(images)}...", file=sys.__stdout__)
+if _cache_store is not None:
+    _cache_store.close()
+
+REPORT_PATH = os.path.join(os.path.dirname(__file__), "batch_scan_results.txt")
+out = open(REPORT_PATH, 'w', encoding='utf-8') if args.output == 'file' else sys.stdout
+
+print(f"\nProcessed {len(images)} images. Errors: {errors}", file=out)
+print(f"OUT_OF_SCOPE (no pest): {out_of_scope}", file=out)
+print("\n" + "=" * 90, file=out)
+print("DETECTION RESULTS BY PEST TYPE", file=out)
+print("=" * 90, file=out)
+
+for pest in ALL_PESTS:
+    hits = sorted(pest_hits.get(pest, []), key=lambda x: -x[0])
+    if hits:
+        print(f"\n{pest}: {len(hits)} detections", file=out)
+        for conf, tta, total, fname in hits[:args.top]:
+            print(f"  {conf:>5.1f}% | TTA {tta}/{total} | {fname}", file=out)
+        if len(hits) > args.top:
+            print(f"  ... and {len(hits) - args.top} more", file=out)
+    else:
+        print(f"\n{pest}: *** NO DETECTIONS FOUND ***", file=out)
+
+print("\n" + "=" * 90, file=out)
+print("SUMMARY", file=out)
+print("=" * 90, file=out)
+detected_types = set(pest_hits.keys())
+print(f"Detected pest types: {len(detected_types)}/7", file=out)
+for p in ALL_PESTS:
+    count = len(pest_hits.get(p, []))
+    print(f"  {'[OK]' if count else '[!!]'} {p:<22} - {count} images", file=out)
+
+missing = set(ALL_PESTS) - detected_types
+extra = detected_types - set(ALL_PESTS)
+if missing:
+    print(f"\nMISSING TYPES: {', '.join(sorted(missing))}", file=out)
+    print("  These pest types were not detected in any of the scanned images.", file=out)
+    print("  This may be because no test images of these pests exist in uploads.", file=out)
+if extra:
+    print(f"\nUNEXPECTED TYPES: {', '.join(sorted(extra))}", file=out)
+
+if out is not sys.stdout:
+    out.close()
+    print(f"Report written to {REPORT_PATH}")
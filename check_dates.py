@@ -1,5 +1,5 @@
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 
 conn = sqlite3.connect('c:/xampp/htdocs/cocoguard-backend/cocoguard.db')
 cur = conn.cursor()
@@ -10,27 +10,20 @@ row = cur.fetchone()[0]
 print(f'DB format: {repr(row)}')
 print(f'Type: {type(row)}')
 
-# Count scans today using string comparison
-cur.execute('SELECT COUNT(*) FROM scans WHERE created_at >= "2026-02-05 00:00:00"')
-c1 = cur.fetchone()[0]
-print(f'String >= 2026-02-05 00:00:00 count: {c1}')
+# Index makes the range query below O(log N) instead of a table scan
+cur.execute('CREATE INDEX IF NOT EXISTS idx_scans_created ON scans(created_at)')
 
-# Count using date() function
-cur.execute('SELECT COUNT(*) FROM scans WHERE date(created_at) = "2026-02-05"')
-c2 = cur.fetchone()[0]
-print(f'date(created_at) = 2026-02-05 count: {c2}')
-
-# Compare with parameterized query
+# Count scans today with a half-open range on the bare column.
+# (`date(created_at) = ?` is un-sargable — SQLite would have to apply
+# date() to every row, so the index could never be used.)
 start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-print(f'\nPython datetime: {start}')
-print(f'Python datetime str: {str(start)}')
-cur.execute('SELECT COUNT(*) FROM scans WHERE created_at >= ?', (start,))
-c3 = cur.fetchone()[0]
-print(f'Parameterized count: {c3}')
-
-# Try with string
-cur.execute('SELECT COUNT(*) FROM scans WHERE created_at >= ?', (str(start),))
-c4 = cur.fetchone()[0]
-print(f'Parameterized string count: {c4}')
+end = start + timedelta(days=1)
+print(f'\nToday (UTC): {start} .. {end}')
+cur.execute(
+    'SELECT COUNT(*) FROM scans WHERE created_at >= ? AND created_at < ?',
+    (start, end),
+)
+count = cur.fetchone()[0]
+print(f'Scans today: {count}')
 
 conn.close()
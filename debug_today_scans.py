@@ -2,14 +2,24 @@ import sys
 sys.path.insert(0, 'c:/xampp/htdocs/cocoguard-backend')
 
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine, func, and_, text
-from sqlalchemy.orm import sessionmaker
-from app import models
+from sqlalchemy import text
 
-# Connect directly to db
-engine = create_engine('sqlite:///c:/xampp/htdocs/cocoguard-backend/cocoguard.db')
-Session = sessionmaker(bind=engine)
-db = Session()
+DEBUG_SQL = '--debug-sql' in sys.argv
+
+# Module-level prepared statement, reused for both the UTC and local
+# counts: SQLAlchemy caches the compiled form and SQLite reuses the
+# same bytecode across executions, only the :since bind changes.
+COUNT_SINCE_STMT = text("SELECT COUNT(id) FROM scans WHERE created_at >= :since")
+
+# Reuse the app's shared engine/session factory instead of constructing
+# a second engine against the same database file
+from app.database import SessionLocal
+db = SessionLocal()
+
+# Same index check_dates.py maintains: the created_at range counts
+# below are full table scans without it. Idempotent.
+db.execute(text('CREATE INDEX IF NOT EXISTS idx_scans_created ON scans(created_at)'))
+db.commit()
 
 # Replicate exact logic from analytics.py
 now = datetime.utcnow()
@@ -19,20 +29,17 @@ print(f"Current UTC time: {now}")
 print(f"Start of today (UTC): {start_of_today}")
 print()
 
-# Query today's scans
-today_scans_query = db.query(func.count(models.Scan.id)).filter(models.Scan.created_at >= start_of_today)
+if DEBUG_SQL:
+    # Literal-binds rendering defeats statement caching, so it's
+    # opt-in debug output only
+    print(f"SQL Query: {COUNT_SINCE_STMT} [since={start_of_today}]")
+    print()
 
-# Print the actual SQL
-from sqlalchemy.dialects import sqlite
-compiled = today_scans_query.statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
-print(f"SQL Query: {compiled}")
-print()
-
-# Execute
-today_scans = today_scans_query.scalar() or 0
+# Query today's scans
+today_scans = db.execute(COUNT_SINCE_STMT, {"since": start_of_today}).scalar() or 0
 print(f"Today's scans count: {today_scans}")
 
-# Now check scans manually  
+# Now check scans manually
 result = db.execute(text("SELECT created_at FROM scans ORDER BY id DESC LIMIT 5"))
 print("\nLatest 5 scan timestamps:")
 for row in result:
@@ -41,8 +48,7 @@ for row in result:
 # Test with local time
 start_of_today_local = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 print(f"\nStart of today (LOCAL): {start_of_today_local}")
-local_query = db.query(func.count(models.Scan.id)).filter(models.Scan.created_at >= start_of_today_local)
-local_count = local_query.scalar() or 0
+local_count = db.execute(COUNT_SINCE_STMT, {"since": start_of_today_local}).scalar() or 0
 print(f"Count with local start: {local_count}")
 
 db.close()
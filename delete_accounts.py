@@ -1,3 +1,5 @@
+from sqlalchemy import or_
+
 from app.database import SessionLocal
 from app.models import User
 
@@ -24,12 +26,13 @@ TO_DELETE = [
 def delete_accounts():
     db = SessionLocal()
     try:
-        deleted = 0
-        for identifier in TO_DELETE:
-            user = db.query(User).filter((User.email == identifier) | (User.username == identifier)).first()
-            if user:
-                db.delete(user)
-                deleted += 1
+        # One DELETE ... WHERE email IN (...) OR username IN (...) instead
+        # of a SELECT + DELETE round trip per identifier
+        deleted = (
+            db.query(User)
+            .filter(or_(User.email.in_(TO_DELETE), User.username.in_(TO_DELETE)))
+            .delete(synchronize_session=False)
+        )
         db.commit()
         print(f"Deleted {deleted} user(s) from the database.")
     except Exception as e:
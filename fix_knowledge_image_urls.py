@@ -1,5 +1,6 @@
 
 import os
+import re
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.models import KnowledgeArticle
@@ -12,26 +13,44 @@ engine = create_engine(DATABASE_URI)
 Session = sessionmaker(bind=engine)
 session = Session()
 
-# Get all actual image filenames in uploads/files
-actual_files = set(os.listdir(UPLOADS_DIR))
+# Get all actual image filenames in uploads/files; scandir streams
+# DirEntry objects (skipping directories without extra stat calls)
+# instead of materializing an intermediate name list first
+with os.scandir(UPLOADS_DIR) as it:
+    actual_files = frozenset(e.name for e in it if e.is_file())
 
+# Precomputed lookup maps so each article does two dict probes instead
+# of a substring scan over every filename (O(A*F) in pure Python)
+files_by_id = {}
+files_by_name = {}
+for f in actual_files:
+    for tok in re.findall(r'\d+', f):
+        files_by_id.setdefault(int(tok), f)
+    # Key by the extension-stripped stem so a title slug like
+    # 'rhinoceros_beetle' can actually hit 'rhinoceros_beetle.jpg'
+    files_by_name.setdefault(os.path.splitext(f)[0].lower(), f)
+
+updates = []
 articles = session.query(KnowledgeArticle).all()
 for article in articles:
-    if article.image_url:
-        # Only the filename part
-        filename = os.path.basename(article.image_url)
-        if filename not in actual_files:
-            # Try to find a matching file by article id or title
-            for f in actual_files:
-                if str(article.id) in f or article.title.replace(' ', '_').lower() in f.lower():
-                    print(f"Updating article {article.id}: {article.image_url} -> uploads/files/{f}")
-                    article.image_url = f"uploads/files/{f}"
-                    break
-        else:
-            # Set to correct relative path if not already
-            if not article.image_url.startswith('uploads/files/'):
-                print(f"Fixing path for article {article.id}: {article.image_url} -> uploads/files/{filename}")
-                article.image_url = f"uploads/files/{filename}"
+    if not article.image_url:
+        continue
+    # Only the filename part
+    filename = os.path.basename(article.image_url)
+    if filename not in actual_files:
+        # Try to find a matching file by article id or title slug
+        slug = article.title.replace(' ', '_').lower()
+        candidate = files_by_id.get(article.id) or files_by_name.get(slug)
+        if candidate:
+            print(f"Updating article {article.id}: {article.image_url} -> uploads/files/{candidate}")
+            updates.append({"id": article.id, "image_url": f"uploads/files/{candidate}"})
+    elif not article.image_url.startswith('uploads/files/'):
+        # Set to correct relative path if not already
+        print(f"Fixing path for article {article.id}: {article.image_url} -> uploads/files/{filename}")
+        updates.append({"id": article.id, "image_url": f"uploads/files/{filename}"})
 
+# One bulk flush instead of dirtying ORM instances one at a time
+if updates:
+    session.bulk_update_mappings(KnowledgeArticle, updates)
 session.commit()
 print("Image URLs updated where possible.")
@@ -5,19 +5,42 @@ Also check for scans that were DETECTED when they shouldn't have been
 """
 import sqlite3
 
-conn = sqlite3.connect('cocoguard.db')
+from sqlite_tuning import configure
+
+conn = configure(sqlite3.connect('cocoguard.db'))
 cursor = conn.cursor()
 
-# 1. Fix scans where notes say Out-of-Scope but pest_type_id is not NULL
-print("=== Fixing Out-of-Scope scans with non-null pest_type_id ===")
+# Partial index over the rows this script ever touches; the leading-%
+# LIKE on notes can't use an index, but this narrows the scan to the
+# pest_type_id IS NOT NULL subset. Idempotent.
 cursor.execute("""
-    SELECT id, pest_type_id, notes FROM scans 
-    WHERE notes LIKE '%Out-of-Scope%' AND pest_type_id IS NOT NULL
+    CREATE INDEX IF NOT EXISTS idx_scans_pest_notes
+    ON scans(pest_type_id) WHERE pest_type_id IS NOT NULL
 """)
-rows = cursor.fetchall()
-for row in rows:
-    print(f"  Scan {row[0]}: pest_type_id={row[1]}, notes={row[2]} -> Setting pest_type_id=NULL")
-    cursor.execute("UPDATE scans SET pest_type_id = NULL WHERE id = ?", (row[0],))
+
+# 1. Fix scans where notes say Out-of-Scope but pest_type_id is not NULL
+print("=== Fixing Out-of-Scope scans with non-null pest_type_id ===")
+# One explicit transaction and one UPDATE ... WHERE id IN (...) instead
+# of an implicitly-committed (and fsynced) UPDATE per row
+with conn:
+    cursor.execute("""
+        SELECT id, pest_type_id, notes FROM scans
+        WHERE notes LIKE '%Out-of-Scope%' AND pest_type_id IS NOT NULL
+    """)
+    rows = cursor.fetchall()
+    for row in rows:
+        print(f"  Scan {row[0]}: pest_type_id={row[1]}, notes={row[2]} -> Setting pest_type_id=NULL")
+    # Chunked to stay under SQLITE_MAX_VARIABLE_NUMBER (999 bound
+    # parameters per statement); sqlite3 reuses the compiled statement
+    # for the equal-sized chunks.
+    ids = [row[0] for row in rows]
+    for start in range(0, len(ids), 999):
+        chunk = ids[start:start + 999]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(
+            f"UPDATE scans SET pest_type_id = NULL WHERE id IN ({placeholders})",
+            chunk,
+        )
 
 if not rows:
     print("  (None found)")
@@ -30,10 +53,9 @@ cursor.execute("""
     LEFT JOIN pest_types pt ON s.pest_type_id = pt.id
     ORDER BY s.id DESC LIMIT 20
 """)
-for row in cursor.fetchall():
+for row in cursor:
     status = "✅ DETECTED" if row[1] else "❌ OUT_OF_SCOPE"
     print(f"  Scan {row[0]}: {status} | pest_type_id={row[1]} ({row[2]}) | conf={row[3]} | notes={row[4][:60] if row[4] else 'N/A'}...")
 
-conn.commit()
 conn.close()
 print("\nDone!")
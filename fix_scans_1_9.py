@@ -1,34 +1,50 @@
 import sqlite3
-conn = sqlite3.connect('cocoguard.db')
+
+from sqlite_tuning import configure
+
+conn = configure(sqlite3.connect('cocoguard.db'))
 c = conn.cursor()
 
+# Per-scan corrections: id -> (pest_type_id, confidence, notes)
 # Scan 1: White Grub 68.22% (4/4 TTA agreement)
-c.execute("""
-    UPDATE scans 
-    SET pest_type_id = 7, 
-        confidence = 68.22, 
-        notes = 'Detected: White Grub (68.22%, TTA 4/4) [corrected from false Out-of-Scope]'
-    WHERE id = 1
-""")
-print(f"Scan 1 updated: {c.rowcount} row(s)")
-
 # Scan 9: APW Larvae 68.1% (3/4 TTA agreement)
-c.execute("""
-    UPDATE scans 
-    SET pest_type_id = 2, 
-        confidence = 68.1, 
-        notes = 'Detected: APW Larvae (68.1%, TTA 3/4) [corrected from false Out-of-Scope]'
-    WHERE id = 9
-""")
-print(f"Scan 9 updated: {c.rowcount} row(s)")
+FIXES = {
+    1: (7, 68.22, 'Detected: White Grub (68.22%, TTA 4/4) [corrected from false Out-of-Scope]'),
+    9: (2, 68.1, 'Detected: APW Larvae (68.1%, TTA 3/4) [corrected from false Out-of-Scope]'),
+}
+
+# One CASE-WHEN UPDATE covering every scan instead of one statement each
+cases = " WHEN ? THEN ?" * len(FIXES)
+placeholders = ",".join("?" * len(FIXES))
+params = []
+for col in range(3):
+    for sid, fix in FIXES.items():
+        params.extend((sid, fix[col]))
+params.extend(FIXES)
+c.execute(f"""
+    UPDATE scans
+    SET pest_type_id = CASE id{cases} END,
+        confidence = CASE id{cases} END,
+        notes = CASE id{cases} END
+    WHERE id IN ({placeholders})
+""", params)
+print(f"Scans {sorted(FIXES)} updated: {c.rowcount} row(s)")
 
 conn.commit()
 
-# Verify
-for sid in [1, 9]:
-    c.execute('SELECT id, pest_type_id, confidence, notes FROM scans WHERE id=?', (sid,))
-    row = c.fetchone()
-    print(f'Verified Scan {sid}: pest_type_id={row[1]}, confidence={row[2]}, notes={row[3]}')
+# Verify with one IN query instead of a SELECT per scan; keyed by id so
+# the report follows FIXES order, not whatever order the rows come back
+c.execute(
+    f'SELECT id, pest_type_id, confidence, notes FROM scans WHERE id IN ({placeholders})',
+    list(FIXES),
+)
+found = {row[0]: row for row in c.fetchall()}
+for sid in FIXES:
+    row = found.get(sid)
+    if row is None:
+        print(f'Verified Scan {sid}: NOT FOUND')
+    else:
+        print(f'Verified Scan {sid}: pest_type_id={row[1]}, confidence={row[2]}, notes={row[3]}')
 
 conn.close()
 print("Done!")
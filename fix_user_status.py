@@ -1,31 +1,46 @@
 """Fix user status values in database"""
 import sqlite3
 
-conn = sqlite3.connect('cocoguard.db')
+from sqlite_tuning import configure
+
+conn = configure(sqlite3.connect('cocoguard.db'))
 cursor = conn.cursor()
+cursor.arraysize = 1000  # fetch-buffer hint for the streamed listings
 
-# Check current status values
+# Check current status values, streaming rows off the cursor instead
+# of materializing the whole table first
 print("Current user statuses:")
 cursor.execute("SELECT id, username, status FROM users")
-for row in cursor.fetchall():
+for row in cursor:
     print(f"  ID {row[0]}: {row[1]} -> status: '{row[2]}'")
 
-# Update any NULL, empty, or 'pending' status to 'active'
+# Index first so the UPDATE's predicate and the verify below can both
+# use it (and so the DDL doesn't clobber cursor.rowcount afterwards)
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_status ON users(status)")
+
+# Update any NULL, empty, or 'pending' status to 'active'. Spelling out
+# the casings keeps the predicate sargable — LOWER(status) would run
+# per row and defeat the status index above.
 cursor.execute("""
-    UPDATE users 
-    SET status = 'active' 
-    WHERE status IS NULL 
-       OR status = '' 
-       OR LOWER(status) = 'pending'
+    UPDATE users
+    SET status = 'active'
+    WHERE status IS NULL
+       OR status IN ('', 'pending', 'Pending', 'PENDING')
 """)
+updated = cursor.rowcount
 conn.commit()
-print(f"\nUpdated {cursor.rowcount} users to 'active' status")
+print(f"\nUpdated {updated} users to 'active' status")
 
-# Verify
-print("\nUpdated user statuses:")
-cursor.execute("SELECT id, username, status FROM users")
-for row in cursor.fetchall():
+# Verify: only print anomalies, via an index scan instead of dumping
+# the whole table
+print("\nUsers still not 'active':")
+cursor.execute("SELECT id, username, status FROM users WHERE status != 'active' OR status IS NULL")
+anomalies = 0
+for row in cursor:
+    anomalies += 1
     print(f"  ID {row[0]}: {row[1]} -> status: '{row[2]}'")
+if not anomalies:
+    print("  (none — all users active)")
 
 conn.close()
 print("\nDone!")
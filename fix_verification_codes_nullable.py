@@ -5,13 +5,22 @@ SQLite doesn't support ALTER COLUMN, so we recreate the table.
 import sqlite3
 import os
 
+from sqlite_tuning import configure
+
 DB_PATH = os.path.join(os.path.dirname(__file__), "cocoguard.db")
 
-conn = sqlite3.connect(DB_PATH)
+conn = configure(sqlite3.connect(DB_PATH))
 cursor = conn.cursor()
 
 print("Fixing verification_codes table: making user_id nullable...")
 
+# Rebuild inside one explicit transaction with FK checks off, so the
+# copy isn't validated row-by-row and each step isn't auto-committed;
+# legacy_alter_table keeps the RENAME from rewriting FK references.
+cursor.execute("PRAGMA foreign_keys=OFF")
+cursor.execute("PRAGMA legacy_alter_table=ON")
+cursor.execute("BEGIN")
+
 # 1. Rename old table
 cursor.execute("ALTER TABLE verification_codes RENAME TO verification_codes_old;")
 
@@ -40,7 +49,11 @@ FROM verification_codes_old;
 # 4. Drop old table
 cursor.execute("DROP TABLE verification_codes_old;")
 
+# Refresh planner stats for the rebuilt table before committing
+cursor.execute("ANALYZE verification_codes;")
+
 conn.commit()
+cursor.execute("PRAGMA foreign_keys=ON")
 conn.close()
 
 print("Done! verification_codes.user_id is now nullable.")
@@ -1,14 +1,20 @@
 import sys
 sys.path.insert(0, '.')
 
+from sqlalchemy import inspect
+
 from app.database import SessionLocal, engine, Base
 from app.models import User, UserRole, UserStatus
 from app.auth_utils import get_password_hash
 
-# Create all tables
-print("Creating database tables...")
-Base.metadata.create_all(bind=engine)
-print("✓ Tables created")
+# Create all tables. create_all walks every table's metadata even when
+# nothing is missing, so short-circuit with one sqlite_master lookup.
+if not inspect(engine).has_table('users'):
+    print("Creating database tables...")
+    Base.metadata.create_all(bind=engine)
+    print("✓ Tables created")
+else:
+    print("✓ Tables already exist")
 
 # Create a new session
 db = SessionLocal()
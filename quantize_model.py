@@ -0,0 +1,87 @@
+"""
+Convert the pest-detection model to INT8 with post-training quantization.
+
+Produces assets/model/best_int8.tflite, which the prediction service
+prefers over best_float16.tflite when present (it feeds uint8 pixels
+straight in and dequantizes the output tensor). INT8 halves the bytes
+moved per invoke and unlocks the NEON dot-product / x86 VNNI kernels.
+
+Needs the original SavedModel export (the shipped .tflite cannot be
+re-converted), e.g. from Ultralytics:  yolo export format=saved_model
+Run:  python quantize_model.py [path/to/saved_model]
+"""
+import glob
+import os
+import sys
+
+import numpy as np
+import tensorflow as tf
+from PIL import Image
+
+BASE_DIR = os.path.dirname(__file__)
+SAVED_MODEL_DIR = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+    BASE_DIR, "assets", "model", "best_saved_model"
+)
+OUTPUT_PATH = os.path.join(BASE_DIR, "assets", "model", "best_int8.tflite")
+SCAN_DIR = os.path.join(BASE_DIR, "uploads", "scans")
+INPUT_SIZE = 640
+NUM_CALIBRATION_IMAGES = 100
+
+if not os.path.isdir(SAVED_MODEL_DIR):
+    print(f"ERROR: SavedModel not found at {SAVED_MODEL_DIR}")
+    print("Export it first (e.g. `yolo export format=saved_model`) or pass the path:")
+    print("  python quantize_model.py path/to/saved_model")
+    sys.exit(1)
+
+images = sorted(glob.glob(os.path.join(SCAN_DIR, "*.jpg")))[:NUM_CALIBRATION_IMAGES]
+if not images:
+    print(f"ERROR: No calibration images in {SCAN_DIR}")
+    print("Quantization needs representative field images to calibrate ranges.")
+    sys.exit(1)
+
+print(f"Calibrating with {len(images)} images from {SCAN_DIR}")
+
+
+def _letterbox(img: Image.Image) -> np.ndarray:
+    """Match the service's preprocessing: aspect-preserving resize onto
+    a gray 640x640 canvas, normalized to [0, 1] float32."""
+    w, h = img.size
+    scale = min(INPUT_SIZE / w, INPUT_SIZE / h)
+    nw, nh = int(w * scale), int(h * scale)
+    canvas = np.full((INPUT_SIZE, INPUT_SIZE, 3), 114, dtype=np.uint8)
+    resized = np.asarray(img.convert("RGB").resize((nw, nh), Image.BILINEAR))
+    top = (INPUT_SIZE - nh) // 2
+    left = (INPUT_SIZE - nw) // 2
+    canvas[top:top + nh, left:left + nw] = resized
+    return canvas.astype(np.float32) / 255.0
+
+
+def representative_dataset():
+    for path in images:
+        try:
+            with Image.open(path) as img:
+                yield [_letterbox(img)[np.newaxis, ...]]
+        except Exception as e:
+            print(f"  skipping {os.path.basename(path)}: {e}")
+
+
+converter = tf.lite.TFLiteConverter.from_saved_model(SAVED_MODEL_DIR)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+converter.representative_dataset = representative_dataset
+converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+converter.inference_input_type = tf.uint8
+# Keep the output quantized too (the default would append a dequantize
+# op and emit float32); the service restores floats via scale/zero_point
+converter.inference_output_type = tf.int8
+
+print("Converting (this can take several minutes)...")
+tflite_model = converter.convert()
+
+with open(OUTPUT_PATH, "wb") as f:
+    f.write(tflite_model)
+
+size_mb = os.path.getsize(OUTPUT_PATH) / (1024 * 1024)
+print(f"Wrote {OUTPUT_PATH} ({size_mb:.1f} MB)")
+print("The prediction service will pick it up automatically on next start.")
+print("Spot-check detections afterwards: quantization shifts confidences a few")
+print("points, so thresholds may need a small re-tune (test_tflite_model.py).")
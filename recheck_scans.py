@@ -1,9 +1,12 @@
-from app.services.prediction_service import PestPredictionService as PredictionService
-from PIL import Image
 import os
+os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1')
+
+from app.services.prediction_service import get_prediction_service
+from PIL import Image
 
-svc = PredictionService()
-svc.load_model()
+# Shared singleton: the model loads once per process even if another
+# recheck script is imported alongside this one
+svc = get_prediction_service()
 
 for img_name in ['scan_20260216_174539_9eeee086.jpg', 'scan_20260216_175000_381b105c.jpg']:
     path = os.path.join('uploads', 'scans', img_name)
@@ -28,17 +28,36 @@ if not svc.model_loaded:
 DETECTED_THRESHOLD = 60.0
 UNCERTAIN_THRESHOLD = 45.0
 
+
+def parse_result(s):
+    """Parse a '[STATUS:] Pest (conf%)' result string to (is_oos, pest).
+
+    One auditable parser for both the DB strings and the freshly built
+    ones, instead of ad-hoc split/membership chains in the loop.
+    """
+    oos = 'OUT_OF_SCOPE' in s
+    pest = 'OOS' if oos else s.split(':', 1)[-1].split('(', 1)[0].strip()
+    return oos, pest
+
 print("=" * 90)
 print(f"{'ID':>3} | {'Original DB Result':<35} | {'New Result (minAgreement=2)':<35} | Match?")
 print("=" * 90)
 
-for scan_id, (fname, original) in sorted(scans.items()):
-    path = os.path.join(UPLOADS, fname)
-    if not os.path.exists(path):
+# All seven images go through one batched forward pass instead of a
+# separate model call per scan
+ordered = sorted(scans.items())
+paths = [os.path.join(UPLOADS, fname) for _, (fname, _) in ordered]
+existing = [p for p in paths if os.path.exists(p)]
+batch_results = dict(zip(
+    existing, svc.predict_batch_from_paths(existing, confidence_threshold=0.55)
+))
+
+for (scan_id, (fname, original)), path in zip(ordered, paths):
+    if path not in batch_results:
         print(f"{scan_id:>3} | {original:<35} | FILE NOT FOUND")
         continue
 
-    result = svc.predict_from_path(path, confidence_threshold=0.55)
+    result = batch_results[path]
     preds = result.get('predictions', [])
 
     if preds:
@@ -57,10 +76,8 @@ for scan_id, (fname, original) in sorted(scans.items()):
         new_result = "OUT_OF_SCOPE (0%)"
 
     # Simple match check
-    orig_is_oos = "OUT_OF_SCOPE" in original
-    new_is_oos = "OUT_OF_SCOPE" in new_result
-    orig_pest = original.split("(")[0].strip() if not orig_is_oos else "OOS"
-    new_pest = new_result.split(":")[1].split("(")[0].strip() if ":" in new_result else "OOS"
+    orig_is_oos, orig_pest = parse_result(original)
+    new_is_oos, new_pest = parse_result(new_result)
 
     if orig_is_oos == new_is_oos:
         match = "YES" if orig_is_oos else ("YES" if orig_pest == new_pest else "DIFF")
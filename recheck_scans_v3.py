@@ -3,6 +3,13 @@ import sys, os
 sys.path.insert(0, os.path.dirname(__file__))
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
+import logging
+
+# The prediction service logs through the logging module, so raising
+# its level is all the suppression needed — no print() monkeypatch
+# intercepting every call with a Python-level join + prefix check.
+logging.getLogger('app.services.prediction_service').setLevel(logging.WARNING)
+
 from app.services.prediction_service import get_prediction_service
 
 UPLOADS = os.path.join(os.path.dirname(__file__), "uploads", "scans")
@@ -21,29 +28,14 @@ svc = get_prediction_service()
 DETECTED_THRESHOLD = 60.0
 UNCERTAIN_THRESHOLD = 45.0
 
-# Suppress verbose model output
-import builtins
-_real_print = builtins.print
-suppress = True
-
-def quiet_print(*args, **kwargs):
-    if suppress:
-        text = ' '.join(str(a) for a in args)
-        if text.startswith("SCAN") or text.startswith("===") or text.startswith("RESULT"):
-            _real_print(*args, **kwargs)
-    else:
-        _real_print(*args, **kwargs)
-
-builtins.print = quiet_print
-
-_real_print("=" * 94)
-_real_print(f"{'ID':>3} | {'Original DB Result':<35} | {'New Result (min_agree=2)':<35} | Match?")
-_real_print("-" * 94)
+print("=" * 94)
+print(f"{'ID':>3} | {'Original DB Result':<35} | {'New Result (min_agree=2)':<35} | Match?")
+print("-" * 94)
 
 for scan_id, (fname, original) in sorted(scans.items()):
     path = os.path.join(UPLOADS, fname)
     if not os.path.exists(path):
-        _real_print(f"{scan_id:>3} | {original:<35} | FILE NOT FOUND")
+        print(f"{scan_id:>3} | {original:<35} | FILE NOT FOUND")
         continue
 
     result = svc.predict_from_path(path, confidence_threshold=0.55)
@@ -71,7 +63,6 @@ for scan_id, (fname, original) in sorted(scans.items()):
     new_oos = "OUT_OF_SCOPE" in new_result
     match = "YES" if orig_oos == new_oos else "CHANGED"
 
-    _real_print(f"{scan_id:>3} | {original:<35} | {new_result:<35} | {match}")
+    print(f"{scan_id:>3} | {original:<35} | {new_result:<35} | {match}")
 
-_real_print("=" * 94)
-builtins.print = _real_print
+print("=" * 94)
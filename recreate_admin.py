@@ -1,7 +1,9 @@
 import sqlite3
 
+from sqlite_tuning import configure
+
 # Delete the old user
-conn = sqlite3.connect('cocoguard.db')
+conn = configure(sqlite3.connect('cocoguard.db'))
 cursor = conn.cursor()
 cursor.execute('DELETE FROM users WHERE id = 1')
 conn.commit()
@@ -12,12 +14,16 @@ conn.close()
 import sys
 sys.path.insert(0, '.')
 
+from sqlalchemy import inspect
+
 from app.database import SessionLocal, engine, Base
 from app.models import User, UserRole, UserStatus
 from app.auth_utils import get_password_hash
 
-# Create tables if they don't exist
-Base.metadata.create_all(bind=engine)
+# Create tables if they don't exist; one sqlite_master lookup skips
+# the full metadata walk on an already-initialized database
+if not inspect(engine).has_table('users'):
+    Base.metadata.create_all(bind=engine)
 
 # Create a new session
 db = SessionLocal()
@@ -4,14 +4,24 @@ SQLite doesn't support DROP COLUMN, so we need to recreate the table.
 """
 import sqlite3
 
+from sqlite_tuning import configure
+
 def migrate():
     db_path = 'c:/xampp/htdocs/cocoguard-backend/cocoguard.db'
-    conn = sqlite3.connect(db_path)
+    conn = configure(sqlite3.connect(db_path))
     cur = conn.cursor()
     
     print("Starting migration: Remove plantation_name and total_trees from farms table...")
     
     try:
+        # Rebuild inside one explicit transaction: the default
+        # autocommit-per-statement would fsync between every step and
+        # validate foreign keys per copied row. legacy_alter_table keeps
+        # the RENAME from rewriting FK references into the temp name.
+        cur.execute("PRAGMA foreign_keys=OFF")
+        cur.execute("PRAGMA legacy_alter_table=ON")
+        cur.execute("BEGIN")
+
         # Step 1: Create new table without the unwanted columns
         cur.execute('''
             CREATE TABLE IF NOT EXISTS farms_new (
@@ -41,8 +51,12 @@ def migrate():
         
         # Step 4: Rename new table
         cur.execute('ALTER TABLE farms_new RENAME TO farms')
-        
+
+        # Refresh planner stats for the rebuilt table before committing
+        cur.execute('ANALYZE farms')
+
         conn.commit()
+        cur.execute("PRAGMA foreign_keys=ON")
         print("✅ Migration completed successfully!")
         
         # Verify
@@ -4,12 +4,16 @@
 import sys
 sys.path.insert(0, '.')
 
+from sqlalchemy import inspect
+
 from app.database import SessionLocal, engine, Base
 from app.models import User, UserRole, UserStatus
 from app.auth_utils import get_password_hash
 
-# Ensure tables exist
-Base.metadata.create_all(bind=engine)
+# Ensure tables exist; one sqlite_master lookup skips the full
+# metadata walk on an already-initialized database
+if not inspect(engine).has_table('users'):
+    Base.metadata.create_all(bind=engine)
 
 db = SessionLocal()
 
@@ -18,12 +22,13 @@ NEW_USERNAME = "admin"
 NEW_PASSWORD = "cocoadmin"
 
 try:
-    # Remove existing admin users
-    admins = db.query(User).filter(User.role == UserRole.admin).all()
-    removed = 0
-    for admin in admins:
-        db.delete(admin)
-        removed += 1
+    # Remove existing admin users with one DELETE ... WHERE role='admin'
+    # instead of loading them and issuing a DELETE per row
+    removed = (
+        db.query(User)
+        .filter(User.role == UserRole.admin)
+        .delete(synchronize_session=False)
+    )
     if removed:
         print(f"Removed {removed} existing admin user(s)")
 
@@ -0,0 +1,24 @@
+"""
+Shared connection pragmas for the raw-sqlite3 maintenance scripts.
+
+sqlite3.connect() defaults to rollback-journal mode with
+synchronous=FULL, so every commit pays two fsyncs. The fix/migration
+scripts are strictly commit-latency bound, so they all want the same
+tuning: WAL journal, NORMAL sync, in-memory temp store and a bigger
+page cache. journal_mode=WAL persists in the database file; the other
+pragmas are per-connection and must be re-applied on every connect.
+"""
+
+PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+)
+
+
+def configure(conn):
+    """Apply the standard pragmas to an open sqlite3 connection."""
+    for pragma in PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
@@ -1,6 +1,19 @@
 import requests
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# One pooled session so the login and dashboard calls reuse the same
+# TCP connection instead of handshaking twice
+session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
 # Test the API endpoint directly
 url = "http://192.168.0.188:8000/api/analytics/admin/dashboard/summary"
 
@@ -13,7 +26,7 @@ login_data = {
 
 try:
     # Login
-    login_resp = requests.post(login_url, json=login_data, timeout=10)
+    login_resp = session.post(login_url, json=login_data, timeout=10)
     print(f"Login status: {login_resp.status_code}")
     
     if login_resp.status_code == 200:
@@ -22,13 +35,20 @@ try:
         
         # Call dashboard summary
         headers = {"Authorization": f"Bearer {token}"}
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = session.get(url, headers=headers, timeout=10)
         print(f"\nDashboard API status: {resp.status_code}")
         
         if resp.status_code == 200:
-            data = resp.json()
+            # orjson parses/pretty-prints in C and handles datetimes
+            # natively; stdlib json is the fallback
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(resp.content)
+                pretty = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            else:
+                data = resp.json()
+                pretty = json.dumps(data, indent=2, default=str)
             print(f"\nFull response:")
-            print(json.dumps(data, indent=2, default=str)[:2000])
+            print(pretty[:2000])
             print(f"\ntoday_scans: {data.get('today_scans')}")
             print(f"yesterday_scans: {data.get('yesterday_scans')}")
         else:
@@ -6,8 +6,10 @@ from app.utils.timezone import to_manila_iso
 from datetime import datetime
 import sqlite3
 
-# Get a real notification timestamp from the database
-conn = sqlite3.connect('C:/xampp/htdocs/cocoguard-backend/cocoguard.db')
+# Get a real notification timestamp from the database. Read-only open:
+# this script only inspects one row, so skip the write-lock and
+# journal bookkeeping a default read-write connection sets up.
+conn = sqlite3.connect('file:C:/xampp/htdocs/cocoguard-backend/cocoguard.db?mode=ro', uri=True)
 cur = conn.cursor()
 cur.execute('SELECT id, created_at FROM notifications ORDER BY id DESC LIMIT 1')
 r = cur.fetchone()
@@ -1,11 +1,17 @@
 import requests
 import json
 
+# One pooled session so both probes reuse the same TCP connection
+session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
 BASE_URL = "http://192.168.0.188:8000"
 
 # Try to get the analytics data without authentication first
 try:
-    r = requests.get(f"{BASE_URL}/analytics/admin/dashboard/summary", timeout=10)
+    r = session.get(f"{BASE_URL}/analytics/admin/dashboard/summary", timeout=10)
     print(f"GET /analytics/admin/dashboard/summary: {r.status_code}")
     print(f"Response: {r.text[:500]}")
 except Exception as e:
@@ -15,7 +21,7 @@ print()
 
 # Try the non-admin endpoint
 try:
-    r = requests.get(f"{BASE_URL}/analytics/dashboard/summary", timeout=10)
+    r = session.get(f"{BASE_URL}/analytics/dashboard/summary", timeout=10)
     print(f"GET /analytics/dashboard/summary: {r.status_code}")
     print(f"Response: {r.text[:500]}")
 except Exception as e:
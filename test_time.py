@@ -1,8 +1,11 @@
 import sqlite3
 from datetime import datetime
 
-conn = sqlite3.connect('C:/xampp/htdocs/cocoguard-backend/cocoguard.db')
+# Read-only URI connection: no RESERVED lock or rollback-journal setup,
+# and safe to run while the backend is serving
+conn = sqlite3.connect('file:C:/xampp/htdocs/cocoguard-backend/cocoguard.db?mode=ro', uri=True)
 cur = conn.cursor()
+cur.execute("PRAGMA mmap_size=268435456")
 
 # Test what SQLite's CURRENT_TIMESTAMP returns
 cur.execute("SELECT CURRENT_TIMESTAMP")
@@ -1,10 +1,16 @@
+from sqlalchemy import delete
+
 from app.database import SessionLocal
 from app.models import Feedback
 
 def truncate_feedback():
     db = SessionLocal()
     try:
-        deleted = db.query(Feedback).delete()
+        # Core delete with synchronize_session=False: no instances are
+        # loaded, so skip the identity-map sweep and issue one DELETE
+        deleted = db.execute(
+            delete(Feedback).execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
         print(f"Deleted {deleted} feedback(s) from the feedback table.")
     except Exception as e:
@@ -1,10 +1,16 @@
+from sqlalchemy import delete
+
 from app.database import SessionLocal
 from app.models import Scan
 
 def truncate_scans():
     db = SessionLocal()
     try:
-        deleted = db.query(Scan).delete()
+        # Core delete with synchronize_session=False: no instances are
+        # loaded, so skip the identity-map sweep and issue one DELETE
+        deleted = db.execute(
+            delete(Scan).execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
         print(f"Deleted {deleted} scan(s) from the scans table.")
     except Exception as e:
@@ -1,25 +1,42 @@
 import sqlite3
 
+from sqlite_tuning import configure
+
 DB_PATH = "cocoguard.db"
 
-# Get the first user id from the users table
-GET_USER_SQL = "SELECT id FROM users ORDER BY id ASC LIMIT 1;"
-# Update all feedbacks with null user_id to use this user id
-UPDATE_FEEDBACK_SQL = "UPDATE feedback SET user_id = ? WHERE user_id IS NULL;"
+# Fused SELECT+UPDATE: the subquery resolves the first user id inside
+# SQLite, so there's one statement and one round trip instead of two
+UPDATE_FEEDBACK_SQL = """
+UPDATE feedback
+SET user_id = (SELECT id FROM users ORDER BY id ASC LIMIT 1)
+WHERE user_id IS NULL
+  AND EXISTS (SELECT 1 FROM users);
+"""
+# Partial index so the NULL-user rows are found without a full scan;
+# it stays tiny because it only covers the unassigned rows
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_feedback_user_null
+ON feedback(user_id) WHERE user_id IS NULL;
+"""
 
 def update_feedback_user_ids():
-    conn = sqlite3.connect(DB_PATH)
+    # Autocommit off the table: one explicit BEGIN IMMEDIATE/COMMIT pair
+    # instead of Python toggling transactions per statement. The bigger
+    # statement cache amortizes SQL parse cost if the connection is
+    # reused (default is 128).
+    conn = configure(sqlite3.connect(
+        DB_PATH, cached_statements=256, isolation_level=None))
     try:
         cur = conn.cursor()
-        cur.execute(GET_USER_SQL)
-        row = cur.fetchone()
-        if not row:
-            print("No users found in the database.")
-            return
-        user_id = row[0]
-        cur.execute(UPDATE_FEEDBACK_SQL, (user_id,))
-        conn.commit()
-        print(f"Updated feedbacks with user_id={user_id}.")
+        cur.execute("BEGIN IMMEDIATE")
+        cur.execute(CREATE_INDEX_SQL)
+        cur.execute(UPDATE_FEEDBACK_SQL)
+        updated = cur.rowcount
+        cur.execute("COMMIT")
+        if updated:
+            print(f"Updated {updated} feedbacks with the first user's id.")
+        else:
+            print("No feedbacks needed updating (or no users found).")
     finally:
         conn.close()
 
@@ -1,32 +1,65 @@
 import os
+import re
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models import KnowledgeArticle
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Directory containing images
 IMG_DIR = r'c:\xampp\htdocs\cocoguard_web\uploads\files'
 
 # Get all image files in the directory
 image_files = [f for f in os.listdir(IMG_DIR) if f.startswith('knowledge_') and f.endswith('.jpg')]
 
-# Map base names to full filenames
-image_map = {f.split('_')[-1].replace('.jpg', ''): f for f in image_files}
+# Map lowercased base names to full filenames
+image_map = {f.split('_')[-1].replace('.jpg', '').lower(): f for f in image_files}
+
+# Build the keyword matcher once: each article is then one scan of its
+# text instead of a substring probe per image (O(keys * text) before).
+# Aho-Corasick when installed, a compiled alternation regex otherwise.
+if not image_map:
+    def find_image(text):
+        return None
+elif AHOCORASICK_AVAILABLE:
+    _automaton = ahocorasick.Automaton()
+    for _key, _filename in image_map.items():
+        _automaton.add_word(_key, _filename)
+    _automaton.make_automaton()
+
+    def find_image(text):
+        for _, filename in _automaton.iter(text):
+            return filename
+        return None
+else:
+    _pattern = re.compile('|'.join(
+        re.escape(k) for k in sorted(image_map, key=len, reverse=True)))
+
+    def find_image(text):
+        m = _pattern.search(text)
+        return image_map[m.group(0)] if m else None
+
 
 def update_articles():
     db: Session = SessionLocal()
     articles = db.query(KnowledgeArticle).all()
-    updated = 0
+    updates = []
     for article in articles:
-        # Try to match by pest name in image filename
-        for pest_key, filename in image_map.items():
-            if pest_key.lower() in article.title.lower() or pest_key.lower() in (article.content or '').lower():
-                article.image_url = f'/uploads/files/{filename}'
-                db.add(article)
-                updated += 1
-                break
+        # Lowercase once per article, match pest names in one pass
+        text = f"{article.title} {article.content or ''}".lower()
+        filename = find_image(text)
+        if filename:
+            updates.append({"id": article.id, "image_url": f"/uploads/files/{filename}"})
+    # One bulk flush instead of dirtying ORM instances one at a time
+    if updates:
+        db.bulk_update_mappings(KnowledgeArticle, updates)
     db.commit()
     db.close()
-    print(f'Updated {updated} articles with image URLs.')
+    print(f'Updated {len(updates)} articles with image URLs.')
 
 if __name__ == '__main__':
     update_articles()
@@ -28,9 +28,26 @@ def print_warning(msg):
 def print_info(msg):
     print(f"{Colors.BLUE}ℹ {msg}{Colors.END}")
 
+# One scandir per unique parent directory instead of a stat() syscall
+# per checked path; ~30 probes collapse into a handful of listings
+_dir_cache = {}
+
+def _listing(parent):
+    """Cached {name: is_dir} listing of a directory ({} if unreadable)"""
+    cached = _dir_cache.get(parent)
+    if cached is None:
+        try:
+            with os.scandir(parent or '.') as it:
+                cached = {e.name: e.is_dir() for e in it}
+        except OSError:
+            cached = {}
+        _dir_cache[parent] = cached
+    return cached
+
 def check_file_exists(path, name):
     """Check if a file exists"""
-    if os.path.exists(path):
+    parent, fname = os.path.split(path)
+    if fname in _listing(parent):
         print_success(f"Found: {name}")
         return True
     else:
@@ -39,7 +56,8 @@ def check_file_exists(path, name):
 
 def check_directory_exists(path, name):
     """Check if a directory exists"""
-    if os.path.isdir(path):
+    parent, dname = os.path.split(path)
+    if _listing(parent).get(dname, False):
         print_success(f"Found directory: {name}")
         return True
     else: